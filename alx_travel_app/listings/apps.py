@@ -5,3 +5,6 @@ class ListingsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     # name = 'listings'
     name = 'alx_travel_app.listings'
+
+    def ready(self):
+        from . import signals  # noqa: F401
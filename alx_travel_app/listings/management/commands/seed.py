@@ -1,6 +1,9 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import User
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
 from alx_travel_app.listings.models import Listing, Booking, Review
+from alx_travel_app.listings.signals import update_review_stats
 from decimal import Decimal
 from datetime import datetime, timedelta
 import random
@@ -15,35 +18,81 @@ class Command(BaseCommand):
             action='store_true',
             help='Clear existing data before seeding',
         )
+        parser.add_argument(
+            '--bookings',
+            type=int,
+            default=15,
+            help='Number of bookings to create',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows per INSERT statement when bulk creating',
+        )
 
     def handle(self, *args, **options):
-        if options['clear']:
-            self.stdout.write('Clearing existing data...')
-            Review.objects.all().delete()
-            Booking.objects.all().delete()
-            Listing.objects.all().delete()
-            User.objects.filter(is_superuser=False).delete()
-            self.stdout.write(self.style.SUCCESS('✓ Data cleared'))
+        if options['bookings'] < 0:
+            raise CommandError('--bookings cannot be negative')
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+
+        write = self.stdout.write
+        success = self.style.SUCCESS
+        # Step results are collected and written in one call at the end
+        summary = []
+
+        # Run the whole seed in one transaction so every insert shares a single commit
+        with transaction.atomic():
+            if options['clear']:
+                write('Clearing existing data...')
+                self.clear_tables()
+                User.objects.filter(is_superuser=False).delete()
+                summary.append('✓ Data cleared')
+
+            write('Starting database seeding...')
+
+            # Create sample users (hosts and guests)
+            users = self.create_users()
+            summary.append(f'✓ Created {len(users)} users')
+            hosts = [user for user in users if 'host' in user.username]
+            guests = [user for user in users if 'guest' in user.username]
 
-        self.stdout.write('Starting database seeding...')
+            # Create sample listings
+            listings = self.create_listings(hosts)
+            summary.append(f'✓ Created {len(listings)} listings')
 
-        # Create sample users (hosts and guests)
-        users = self.create_users()
-        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(users)} users'))
+            # Create sample bookings
+            bookings = self.create_bookings(
+                listings,
+                guests,
+                options['bookings'],
+                options['batch_size'],
+                options['verbosity'],
+                write
+            )
+            summary.append(f'✓ Created {bookings} bookings')
 
-        # Create sample listings
-        listings = self.create_listings(users)
-        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(listings)} listings'))
+            # Create sample reviews
+            reviews = self.create_reviews(listings, guests, options['batch_size'])
+            summary.append(f'✓ Created {len(reviews)} reviews')
 
-        # Create sample bookings
-        bookings = self.create_bookings(listings, users)
-        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(bookings)} bookings'))
+        summary.append('\n✨ Database seeding completed successfully!')
+        write(success('\n'.join(summary)))
 
-        # Create sample reviews
-        reviews = self.create_reviews(listings, users)
-        self.stdout.write(self.style.SUCCESS(f'✓ Created {len(reviews)} reviews'))
+    def clear_tables(self):
+        """Empty the review, booking and property tables without loading rows"""
+        # Children first so foreign keys never point at deleted rows
+        models = [Review, Booking, Listing]
+        tables = [connection.ops.quote_name(model._meta.db_table) for model in models]
 
-        self.stdout.write(self.style.SUCCESS('\n✨ Database seeding completed successfully!'))
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute(f"TRUNCATE TABLE {', '.join(tables)} CASCADE")
+            else:
+                # MySQL refuses to TRUNCATE referenced tables and SQLite has no TRUNCATE
+                for table in tables:
+                    cursor.execute(f"DELETE FROM {table}")
 
     def create_users(self):
         """Create sample users"""
@@ -56,24 +105,28 @@ class Command(BaseCommand):
             {'username': 'emma_guest', 'email': 'emma@example.com', 'first_name': 'Emma', 'last_name': 'Davis'},
         ]
 
-        users = []
-        for user_data in users_data:
-            user, created = User.objects.get_or_create(
-                username=user_data['username'],
-                defaults={
-                    'email': user_data['email'],
-                    'first_name': user_data['first_name'],
-                    'last_name': user_data['last_name']
-                }
-            )
-            if created:
-                user.set_password('password123')
-                user.save()
-            users.append(user)
+        # Hash once and insert in one statement; existing usernames are left untouched
+        password = make_password('password123')
+        User.objects.bulk_create(
+            [
+                User(
+                    username=user_data['username'],
+                    email=user_data['email'],
+                    first_name=user_data['first_name'],
+                    last_name=user_data['last_name'],
+                    password=password
+                )
+                for user_data in users_data
+            ],
+            ignore_conflicts=True
+        )
 
-        return users
+        # Return users in users_data order so host assignment is stable across backends
+        usernames = [user_data['username'] for user_data in users_data]
+        users = {user.username: user for user in User.objects.filter(username__in=usernames)}
+        return [users[username] for username in usernames]
 
-    def create_listings(self, users):
+    def create_listings(self, hosts):
         """Create sample property listings"""
         listings_data = [
             {
@@ -127,53 +180,70 @@ class Command(BaseCommand):
         ]
 
         listings = []
-        hosts = [user for user in users if 'host' in user.username]
-        
         for i, listing_data in enumerate(listings_data):
-            listing = Listing.objects.create(
+            listings.append(Listing(
                 host=hosts[i % len(hosts)],
                 **listing_data
-            )
-            listings.append(listing)
+            ))
+
+        # property_id is generated client-side, so one multi-row INSERT suffices
+        Listing.objects.bulk_create(listings)
 
         return listings
 
-    def create_bookings(self, listings, users):
-        """Create sample bookings"""
-        bookings = []
-        guests = [user for user in users if 'guest' in user.username]
-        statuses = ['pending', 'confirmed', 'confirmed', 'confirmed', 'canceled']
-
-        for i in range(15):
-            listing = random.choice(listings)
-            guest = random.choice(guests)
-            
-            # Generate random dates
-            start_offset = random.randint(-30, 60)
-            duration = random.randint(2, 14)
-            start_date = datetime.now().date() + timedelta(days=start_offset)
-            end_date = start_date + timedelta(days=duration)
-            
-            # Calculate total price
-            total_price = listing.price_per_night * duration
-
-            booking = Booking.objects.create(
-                property=listing,
-                user=guest,
-                start_date=start_date,
-                end_date=end_date,
-                total_price=total_price,
-                status=random.choice(statuses)
-            )
-            bookings.append(booking)
+    def create_bookings(self, listings, guests, count, batch_size, verbosity=1, write=None):
+        """Create sample bookings in batches and return how many were created"""
+        write = write or self.stdout.write
+        created = 0
+        statuses = [
+            Booking.Status.PENDING,
+            Booking.Status.CONFIRMED,
+            Booking.Status.CONFIRMED,
+            Booking.Status.CONFIRMED,
+            Booking.Status.CANCELED,
+        ]
+        today = datetime.now().date()
 
-        return bookings
+        # Build and insert one batch at a time so memory stays flat for large counts
+        for batch_start in range(0, count, batch_size):
+            size = min(batch_size, count - batch_start)
+            bookings = []
 
-    def create_reviews(self, listings, users):
+            # Draw every random column up front instead of per iteration
+            booking_listings = random.choices(listings, k=size)
+            booking_guests = random.choices(guests, k=size)
+            booking_statuses = random.choices(statuses, k=size)
+            start_offsets = random.choices(range(-30, 61), k=size)
+            durations = random.choices(range(2, 15), k=size)
+
+            for listing, guest, status, start_offset, duration in zip(
+                booking_listings, booking_guests, booking_statuses, start_offsets, durations
+            ):
+                start_date = today + timedelta(days=start_offset)
+                end_date = start_date + timedelta(days=duration)
+
+                # Calculate total price
+                total_price = listing.price_per_night * duration
+
+                bookings.append(Booking(
+                    property=listing,
+                    user=guest,
+                    start_date=start_date,
+                    end_date=end_date,
+                    total_price=total_price,
+                    status=status
+                ))
+
+            Booking.objects.bulk_create(bookings)
+            created += len(bookings)
+            # Progress is reported once per batch, never per row
+            if verbosity > 1:
+                write(f'  ... {created}/{count} bookings inserted')
+
+        return created
+
+    def create_reviews(self, listings, guests, batch_size):
         """Create sample reviews"""
-        reviews = []
-        guests = [user for user in users if 'guest' in user.username]
-        
         review_comments = [
             "Amazing place! Highly recommended for anyone visiting the area.",
             "Great location and very clean. The host was very responsive.",
@@ -187,18 +257,24 @@ class Command(BaseCommand):
             "Decent property but not quite what we expected from the photos.",
         ]
 
-        # Create 1-3 reviews for random listings
-        for listing in random.sample(listings, min(6, len(listings))):
-            num_reviews = random.randint(1, 3)
-            review_guests = random.sample(guests, min(num_reviews, len(guests)))
-            
-            for guest in review_guests:
-                review = Review.objects.create(
-                    property=listing,
-                    user=guest,
-                    rating=random.randint(3, 5),
-                    comment=random.choice(review_comments)
-                )
-                reviews.append(review)
+        # Pick 1-3 distinct guests for random listings; (property, user) must stay unique
+        pairs = [
+            (listing, guest)
+            for listing in random.sample(listings, min(6, len(listings)))
+            for guest in random.sample(guests, min(random.randint(1, 3), len(guests)))
+        ]
+
+        # Draw every rating and comment in one call each instead of per review
+        ratings = random.choices(range(3, 6), k=len(pairs))
+        comments = random.choices(review_comments, k=len(pairs))
+
+        reviews = [
+            Review(property=listing, user=guest, rating=rating, comment=comment)
+            for (listing, guest), rating, comment in zip(pairs, ratings, comments)
+        ]
+
+        Review.objects.bulk_create(reviews, batch_size=batch_size)
+        # bulk_create skips post_save, so refresh the listing stats in one UPDATE
+        update_review_stats({listing.pk for listing, _ in pairs})
 
         return reviews
\ No newline at end of file
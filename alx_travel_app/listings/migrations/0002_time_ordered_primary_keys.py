@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-15 10:12
+
+import alx_travel_app.listings.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booking',
+            name='booking_id',
+            field=models.UUIDField(default=alx_travel_app.listings.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='listing',
+            name='property_id',
+            field=models.UUIDField(default=alx_travel_app.listings.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='review_id',
+            field=models.UUIDField(default=alx_travel_app.listings.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
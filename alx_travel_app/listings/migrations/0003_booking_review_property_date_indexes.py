@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-15 10:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0002_time_ordered_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['property', '-start_date'], name='idx_booking_prop_start'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['property', '-created_at'], name='idx_review_prop_created'),
+        ),
+        # Both composites lead with property, so they cover its foreign key
+        # and replace both the named and the implicit single-column indexes
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='idx_booking_property',
+        ),
+        migrations.RemoveIndex(
+            model_name='review',
+            name='idx_review_property',
+        ),
+        migrations.AlterField(
+            model_name='booking',
+            name='property',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='bookings', to='listings.listing'),
+        ),
+        migrations.AlterField(
+            model_name='review',
+            name='property',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='listings.listing'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-15 11:05
+
+from django.db import migrations, models
+
+
+STATUS_CODES = {
+    'pending': 0,
+    'confirmed': 1,
+    'canceled': 2,
+}
+
+
+def status_to_code(apps, schema_editor):
+    Booking = apps.get_model('listings', 'Booking')
+    for name, code in STATUS_CODES.items():
+        Booking.objects.filter(status=name).update(status_code=code)
+
+
+def code_to_status(apps, schema_editor):
+    Booking = apps.get_model('listings', 'Booking')
+    for name, code in STATUS_CODES.items():
+        Booking.objects.filter(status_code=code).update(status=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0003_booking_review_property_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='status_code',
+            field=models.SmallIntegerField(choices=[(0, 'Pending'), (1, 'Confirmed'), (2, 'Canceled')], default=0),
+        ),
+        migrations.RunPython(status_to_code, code_to_status),
+        migrations.RemoveField(
+            model_name='booking',
+            name='status',
+        ),
+        migrations.RenameField(
+            model_name='booking',
+            old_name='status_code',
+            new_name='status',
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-15 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0004_booking_status_smallint'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='listing',
+            constraint=models.CheckConstraint(condition=models.Q(('price_per_night__gt', 0)), name='chk_property_price_positive'),
+        ),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.CheckConstraint(condition=models.Q(('rating__gte', 1), ('rating__lte', 5)), name='chk_review_rating_range'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.8 on 2026-10-15 12:02
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_review_stats(apps, schema_editor):
+    Listing = apps.get_model('listings', 'Listing')
+    Review = apps.get_model('listings', 'Review')
+    reviews = (
+        Review.objects.filter(property=models.OuterRef('pk'))
+        .order_by()
+        .values('property')
+    )
+    Listing.objects.update(
+        review_count=Coalesce(
+            models.Subquery(reviews.annotate(count=models.Count('pk')).values('count')),
+            models.Value(0)
+        ),
+        avg_rating=Coalesce(
+            models.Subquery(reviews.annotate(avg=models.Avg('rating')).values('avg')),
+            models.Value(0),
+            output_field=models.DecimalField(max_digits=3, decimal_places=2)
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0005_price_and_rating_check_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='listing',
+            name='avg_rating',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=3),
+        ),
+        migrations.AddField(
+            model_name='listing',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_review_stats, migrations.RunPython.noop),
+    ]
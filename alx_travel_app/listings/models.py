@@ -1,9 +1,28 @@
+import os
+import time
 import uuid
 from django.db import models
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 
+def uuid7():
+    """
+    Generate a time-ordered UUID (RFC 9562 version 7).
+    The leading 48-bit millisecond timestamp makes new keys sort after
+    existing ones, so primary key inserts append to the end of the index
+    instead of landing on random pages as uuid4 keys do.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), 'big')
+    # Stamp the version (7) and RFC 4122 variant bits over the random tail
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
 class Listing(models.Model):
     """
     Model representing a property listing in the travel app.
@@ -11,7 +30,7 @@ class Listing(models.Model):
     """
     property_id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False
     )
     host = models.ForeignKey(
@@ -28,6 +47,13 @@ class Listing(models.Model):
         decimal_places=2,
         validators=[MinValueValidator(0.01)]
     )
+    # Denormalized review stats, kept current by the Review signals
+    avg_rating = models.DecimalField(
+        max_digits=3,
+        decimal_places=2,
+        default=0
+    )
+    review_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -36,6 +62,13 @@ class Listing(models.Model):
         indexes = [
             models.Index(fields=['host'], name='idx_property_host'),
         ]
+        # Enforced by the database so bulk_create and raw writes cannot bypass it
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(price_per_night__gt=0),
+                name='chk_property_price_positive'
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} - {self.location}"
@@ -45,22 +78,22 @@ class Booking(models.Model):
     """
     Model representing a booking for a property listing.
     """
-    STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('confirmed', 'Confirmed'),
-        ('canceled', 'Canceled'),
-    ]
+    class Status(models.IntegerChoices):
+        PENDING = 0, 'Pending'
+        CONFIRMED = 1, 'Confirmed'
+        CANCELED = 2, 'Canceled'
 
     booking_id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False
     )
+    # Indexed through the (property, date) composite index in Meta
     property = models.ForeignKey(
         Listing,
         on_delete=models.CASCADE,
         related_name='bookings',
-        db_index=True
+        db_index=False
     )
     user = models.ForeignKey(
         User,
@@ -75,18 +108,17 @@ class Booking(models.Model):
         decimal_places=2,
         validators=[MinValueValidator(0.01)]
     )
-    status = models.CharField(
-        max_length=10,
-        choices=STATUS_CHOICES,
-        default='pending'
+    status = models.SmallIntegerField(
+        choices=Status.choices,
+        default=Status.PENDING
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'booking'
         indexes = [
-            models.Index(fields=['property'], name='idx_booking_property'),
             models.Index(fields=['user'], name='idx_booking_user'),
+            models.Index(fields=['property', '-start_date'], name='idx_booking_prop_start'),
         ]
 
     def __str__(self):
@@ -94,7 +126,6 @@ class Booking(models.Model):
 
     def clean(self):
         """Validate that end_date is after start_date"""
-        from django.core.exceptions import ValidationError
         if self.end_date and self.start_date and self.end_date <= self.start_date:
             raise ValidationError('End date must be after start date.')
 
@@ -105,14 +136,15 @@ class Review(models.Model):
     """
     review_id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False
     )
+    # Indexed through the (property, date) composite index in Meta
     property = models.ForeignKey(
         Listing,
         on_delete=models.CASCADE,
         related_name='reviews',
-        db_index=True
+        db_index=False
     )
     user = models.ForeignKey(
         User,
@@ -129,11 +161,17 @@ class Review(models.Model):
     class Meta:
         db_table = 'review'
         indexes = [
-            models.Index(fields=['property'], name='idx_review_property'),
             models.Index(fields=['user'], name='idx_review_user'),
+            models.Index(fields=['property', '-created_at'], name='idx_review_prop_created'),
         ]
         # Optionally prevent duplicate reviews from same user for same property
         unique_together = ['property', 'user']
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(rating__gte=1) & models.Q(rating__lte=5),
+                name='chk_review_rating_range'
+            ),
+        ]
 
     def __str__(self):
         return f"Review by {self.user.username} - {self.rating} stars"
\ No newline at end of file
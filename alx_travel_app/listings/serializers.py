@@ -1,6 +1,8 @@
 from rest_framework import serializers
+from django.db.models import F
 from .models import Listing, Booking, Review
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 
 class UserSerializer(serializers.ModelSerializer):# type: ignore[misc]
@@ -11,10 +13,28 @@ class UserSerializer(serializers.ModelSerializer):# type: ignore[misc]
         read_only_fields = ['id']
 
 
+class BookingStatusField(serializers.ChoiceField):
+    """
+    Booking status as 'pending'/'confirmed'/'canceled' on the API,
+    stored as the Booking.Status small integer code.
+    """
+    def __init__(self, **kwargs):
+        choices = [(status.name.lower(), status.label) for status in Booking.Status]
+        super().__init__(choices=choices, **kwargs)
+
+    def to_internal_value(self, data):
+        name = super().to_internal_value(data)
+        return Booking.Status[name.upper()]
+
+    def to_representation(self, value):
+        return Booking.Status(value).name.lower()
+
+
 class ListingSerializer(serializers.ModelSerializer):
     """
     Serializer for Listing model.
     Includes nested host information and summary statistics.
+    Views should build their queryset with setup_eager_loading().
     """
     host = UserSerializer(read_only=True)
     host_id = serializers.PrimaryKeyRelatedField(
@@ -33,24 +53,80 @@ class ListingSerializer(serializers.ModelSerializer):
             'description',
             'location',
             'price_per_night',
+            'avg_rating',
+            'review_count',
+            'created_at',
+            'updated_at'
+        ]
+        read_only_fields = [
+            'property_id',
+            'avg_rating',
+            'review_count',
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['property_id', 'created_at', 'updated_at']
 
-    def validate_price_per_night(self, value):
-        """Ensure price is positive"""
-        if value <= 0:
-            raise serializers.ValidationError("Price per night must be greater than zero.")
-        return value
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the nested host so views avoid one query per listing"""
+        return queryset.select_related('host')
+
+
+class ListingListSerializer(serializers.Serializer):
+    """
+    Simplified serializer for listing in list views.
+    A plain Serializer so list views can feed it the dict rows from
+    list_rows() without instantiating Listing models. Nested use with
+    Listing instances needs host preloaded via select_related.
+    """
+    property_id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    location = serializers.CharField(read_only=True)
+    price_per_night = serializers.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        read_only=True
+    )
+    avg_rating = serializers.DecimalField(
+        max_digits=3,
+        decimal_places=2,
+        read_only=True
+    )
+    review_count = serializers.IntegerField(read_only=True)
+    host_name = serializers.SerializerMethodField()
+
+    def get_host_name(self, obj):
+        """Read host_name from list_rows() dicts or from a Listing's host"""
+        if isinstance(obj, dict):
+            return obj['host_name']
+        return obj.host.username
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the host for host_name when serializing Listing instances"""
+        return queryset.select_related('host')
+
+    @classmethod
+    def list_rows(cls, queryset):
+        """Fetch only the listed columns as dicts, with the host name joined in"""
+        return queryset.values(
+            'property_id',
+            'name',
+            'location',
+            'price_per_night',
+            'avg_rating',
+            'review_count',
+            host_name=F('host__username')
+        )
 
 
 class BookingSerializer(serializers.ModelSerializer):
     """
     Serializer for Booking model.
-    Includes nested property and user information.
+    Includes nested property summary and user information.
+    Views should build their queryset with setup_eager_loading().
     """
-    property = ListingSerializer(read_only=True)
+    property = ListingListSerializer(read_only=True)
     property_id = serializers.PrimaryKeyRelatedField(
         queryset=Listing.objects.all(),
         source='property',
@@ -62,6 +138,7 @@ class BookingSerializer(serializers.ModelSerializer):
         source='user',
         write_only=True
     )
+    status = BookingStatusField(required=False)
     
     class Meta:
         model = Booking
@@ -79,14 +156,17 @@ class BookingSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['booking_id', 'created_at']
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the nested property, its host and the guest in one query"""
+        return queryset.select_related('property__host', 'user')
+
     def validate_booking(self, data):
         """
         Validate that:
         - end_date is after start_date
         - dates are not in the past
         """
-        from django.utils import timezone
-        
         start_date = data.get('start_date')
         end_date = data.get('end_date')
         
@@ -110,9 +190,10 @@ class BookingSerializer(serializers.ModelSerializer):
 class ReviewSerializer(serializers.ModelSerializer):
     """
     Serializer for Review model.
-    Includes nested property and user information.
+    Includes nested property summary and user information.
+    Views should build their queryset with setup_eager_loading().
     """
-    property = ListingSerializer(read_only=True)
+    property = ListingListSerializer(read_only=True)
     property_id = serializers.PrimaryKeyRelatedField(
         queryset=Listing.objects.all(),
         source='property',
@@ -139,33 +220,17 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['review_id', 'created_at']
 
-    def validate_rating(self, value):
-        """Ensure rating is between 1 and 5"""
-        if value < 1 or value > 5:
-            raise serializers.ValidationError("Rating must be between 1 and 5.")
-        return value
-
-
-# Simplified serializers for listing views
-class ListingListSerializer(serializers.ModelSerializer):
-    """Simplified serializer for listing in list views"""
-    host_name = serializers.CharField(source='host.username', read_only=True)
-    
-    class Meta:
-        model = Listing
-        fields = [
-            'property_id',
-            'name',
-            'location',
-            'price_per_night',
-            'host_name'
-        ]
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the nested property, its host and the reviewer in one query"""
+        return queryset.select_related('property__host', 'user')
 
 
 class BookingListSerializer(serializers.ModelSerializer):
     """Simplified serializer for bookings in list views"""
     property_name = serializers.CharField(source='property.name', read_only=True)
     user_name = serializers.CharField(source='user.username', read_only=True)
+    status = BookingStatusField(read_only=True)
     
     class Meta:
         model = Booking
@@ -177,4 +242,9 @@ class BookingListSerializer(serializers.ModelSerializer):
             'end_date',
             'status',
             'total_price'
-        ]
\ No newline at end of file
+        ]
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join the property and guest for property_name and user_name"""
+        return queryset.select_related('property', 'user')
@@ -0,0 +1,104 @@
+import weakref
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Avg, Count, DecimalField, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from .models import Listing, Review
+
+
+def update_review_stats(listing_ids):
+    """
+    Recompute avg_rating and review_count for the given listings
+    in a single UPDATE, without loading any reviews into Python.
+    """
+    reviews = (
+        Review.objects.filter(property=OuterRef('pk'))
+        .order_by()
+        .values('property')
+    )
+    Listing.objects.filter(pk__in=listing_ids).update(
+        review_count=Coalesce(
+            Subquery(reviews.annotate(count=Count('pk')).values('count')),
+            Value(0)
+        ),
+        avg_rating=Coalesce(
+            Subquery(reviews.annotate(avg=Avg('rating')).values('avg')),
+            Value(0),
+            output_field=DecimalField(max_digits=3, decimal_places=2)
+        ),
+    )
+
+
+# Listing ids collected per in-flight Review queryset delete
+_pending_review_deletes = weakref.WeakKeyDictionary()
+
+# User queryset deletes whose reviewed listings are already queued
+_covered_user_deletes = weakref.WeakSet()
+
+
+@receiver(pre_save, sender=Review)
+def remember_review_listing(sender, instance, **kwargs):
+    """Record the stored listing so a review moved elsewhere refreshes both"""
+    if instance._state.adding:
+        return
+    instance._previous_property_id = (
+        Review.objects.filter(pk=instance.pk)
+        .values_list('property_id', flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=Review)
+def refresh_stats_after_review_save(sender, instance, **kwargs):
+    """Keep the listing's review stats in step with its reviews"""
+    listing_ids = {instance.property_id}
+    previous_id = instance.__dict__.pop('_previous_property_id', None)
+    if previous_id is not None:
+        listing_ids.add(previous_id)
+    update_review_stats(listing_ids)
+
+
+@receiver(post_delete, sender=Review)
+def refresh_stats_after_review_delete(sender, instance, origin=None, **kwargs):
+    """Refresh stats when reviews are deleted directly"""
+    # A Listing takes its reviews with it, and User cascades are batched
+    # in refresh_stats_before_user_delete, so skip the per-review UPDATE
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if issubclass(origin_model, (Listing, User)):
+        return
+    if isinstance(origin, QuerySet):
+        # Every review in a queryset delete shares the origin, so collect
+        # their listings and refresh them together once the delete commits
+        listing_ids = _pending_review_deletes.get(origin)
+        if listing_ids is None:
+            listing_ids = _pending_review_deletes[origin] = set()
+            transaction.on_commit(lambda: update_review_stats(listing_ids))
+        listing_ids.add(instance.property_id)
+        return
+    update_review_stats([instance.property_id])
+
+
+@receiver(pre_delete, sender=User)
+def refresh_stats_before_user_delete(sender, instance, origin=None, **kwargs):
+    """Refresh the other listings deleted users reviewed, once per delete"""
+    if isinstance(origin, QuerySet) and issubclass(origin.model, User):
+        # pre_delete fires for every user in the queryset; query them all once
+        if origin in _covered_user_deletes:
+            return
+        _covered_user_deletes.add(origin)
+        users = origin.values('pk')
+    else:
+        users = [instance.pk]
+
+    # The users' own listings are deleted along with them
+    listing_ids = list(
+        Review.objects.filter(user__in=users)
+        .exclude(property__host__in=users)
+        .values_list('property_id', flat=True)
+        .distinct()
+    )
+    if listing_ids:
+        transaction.on_commit(lambda: update_review_stats(listing_ids))
@@ -1,3 +1,175 @@
-from django.test import TestCase
+import uuid
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import Avg, Count
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from .models import Listing, Review, uuid7
+
+
+class UUID7Tests(SimpleTestCase):
+    """Primary keys are RFC 9562 version 7 UUIDs ordered by creation time"""
+
+    def test_version_and_variant(self):
+        key = uuid7()
+        self.assertIsInstance(key, uuid.UUID)
+        self.assertEqual(key.version, 7)
+        self.assertEqual(key.variant, uuid.RFC_4122)
+
+    def test_keys_from_later_milliseconds_sort_after_earlier_ones(self):
+        with mock.patch('time.time_ns', return_value=1_700_000_000_000_000_000):
+            earlier = uuid7()
+        with mock.patch('time.time_ns', return_value=1_700_000_000_001_000_000):
+            later = uuid7()
+        self.assertLess(earlier, later)
+        # MySQL stores UUIDField as char(32), so the hex form must sort too
+        self.assertLess(earlier.hex, later.hex)
+
+
+class ReviewStatsSignalTests(TestCase):
+    """avg_rating and review_count follow Review saves and deletes"""
+
+    def setUp(self):
+        self.host = User.objects.create_user('host', password='password123')
+        self.guest = User.objects.create_user('guest', password='password123')
+        self.other_guest = User.objects.create_user('other_guest', password='password123')
+        self.listing = Listing.objects.create(
+            host=self.host,
+            name='Cozy Beach House',
+            description='Beachfront property.',
+            location='Malibu, California',
+            price_per_night=Decimal('250.00'),
+        )
+
+    def review(self, user, rating):
+        return Review.objects.create(
+            property=self.listing,
+            user=user,
+            rating=rating,
+            comment='Great stay.',
+        )
+
+    def assertStats(self, review_count, avg_rating):
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.review_count, review_count)
+        self.assertEqual(self.listing.avg_rating, Decimal(avg_rating))
+
+    def test_new_listing_has_empty_stats(self):
+        self.assertStats(0, '0.00')
+
+    def test_creating_reviews_updates_stats(self):
+        self.review(self.guest, 4)
+        self.assertStats(1, '4.00')
+
+        self.review(self.other_guest, 5)
+        self.assertStats(2, '4.50')
+
+    def test_updating_rating_recomputes_average(self):
+        review = self.review(self.guest, 4)
+        self.review(self.other_guest, 5)
+
+        review.rating = 2
+        review.save()
+        self.assertStats(2, '3.50')
+
+    def test_moving_review_refreshes_both_listings(self):
+        review = self.review(self.guest, 4)
+        self.review(self.other_guest, 5)
+        other_listing = Listing.objects.create(
+            host=self.host,
+            name='Mountain Retreat Cabin',
+            description='Secluded cabin.',
+            location='Aspen, Colorado',
+            price_per_night=Decimal('180.00'),
+        )
+
+        review.property = other_listing
+        review.save()
+        self.assertStats(1, '5.00')
+        other_listing.refresh_from_db()
+        self.assertEqual(other_listing.review_count, 1)
+        self.assertEqual(other_listing.avg_rating, Decimal('4.00'))
+
+    def test_deleting_review_updates_stats(self):
+        review = self.review(self.guest, 4)
+        self.review(self.other_guest, 5)
+
+        review.delete()
+        self.assertStats(1, '5.00')
+
+    def test_queryset_delete_refreshes_listing_once(self):
+        self.review(self.guest, 4)
+        self.review(self.other_guest, 5)
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                Review.objects.all().delete()
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(len(updates), 1)
+        self.assertStats(0, '0.00')
+
+    def test_deleting_last_review_resets_stats(self):
+        review = self.review(self.guest, 4)
+
+        review.delete()
+        self.assertStats(0, '0.00')
+
+    def test_deleting_reviewer_refreshes_listing_once_committed(self):
+        self.review(self.guest, 4)
+        self.review(self.other_guest, 5)
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.guest.delete()
+        self.assertEqual(len(callbacks), 1)
+        self.assertStats(1, '5.00')
+
+    def test_queryset_delete_of_reviewers_queries_reviews_once(self):
+        self.review(self.guest, 4)
+        self.review(self.other_guest, 5)
+        reviewers = User.objects.filter(username__in=['guest', 'other_guest'])
+
+        with CaptureQueriesContext(connection) as queries:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                reviewers.delete()
+        review_table = connection.ops.quote_name(Review._meta.db_table)
+        # The reviewed-listings lookup is the only DISTINCT query on reviews
+        stat_lookups = [
+            q['sql'] for q in queries
+            if q['sql'].startswith('SELECT DISTINCT') and f'FROM {review_table}' in q['sql']
+        ]
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(len(stat_lookups), 1)
+        self.assertStats(0, '0.00')
+
+    def test_deleting_listing_skips_per_review_updates(self):
+        self.review(self.guest, 4)
+        self.review(self.other_guest, 5)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.listing.delete()
+        updates = [q['sql'] for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(updates, [])
+
+
+class SeedReviewStatsTests(TestCase):
+    """The seed command refreshes stats after bulk inserting reviews"""
+
+    def test_seed_sets_review_stats(self):
+        call_command('seed', stdout=StringIO())
+
+        listings = Listing.objects.annotate(
+            expected_count=Count('reviews'),
+            expected_avg=Avg('reviews__rating'),
+        )
+        self.assertTrue(any(listing.expected_count for listing in listings))
+        for listing in listings:
+            self.assertEqual(listing.review_count, listing.expected_count)
+            expected_avg = Decimal(listing.expected_avg or 0).quantize(Decimal('0.01'))
+            self.assertEqual(listing.avg_rating, expected_avg)